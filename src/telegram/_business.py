@@ -509,7 +509,9 @@ class BusinessOpeningHoursInterval(TelegramObject):
         self._freeze()
 
     def _parse_minute(self, minute: int) -> tuple[int, int, int]:
-        return (minute // 1440, minute % 1440 // 60, minute % 1440 % 60)
+        day, minute_of_day = divmod(minute, 1440)
+        hour, minute_of_hour = divmod(minute_of_day, 60)
+        return (day, hour, minute_of_hour)
 
     @property
     def opening_time(self) -> tuple[int, int, int]:
@@ -60,7 +60,11 @@ class InlineQueryResult(TelegramObject):
         super().__init__(api_kwargs=api_kwargs)
 
         # Required
-        self.type: str = enum.get_member(constants.InlineQueryResultType, type, type)
+        # The subclasses always pass an enum member, so skip the lookup in that case
+        if type.__class__ is constants.InlineQueryResultType:
+            self.type: str = type
+        else:
+            self.type = enum.get_member(constants.InlineQueryResultType, type, type)
         self.id: str = str(id)
 
         self._id_attrs = (self.id,)
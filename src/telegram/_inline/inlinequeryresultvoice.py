@@ -99,6 +99,7 @@ class InlineQueryResultVoice(InlineQueryResult):
     """
 
     __slots__ = (
+        "_cached_dict",
         "_voice_duration",
         "caption",
         "caption_entities",
@@ -125,18 +126,56 @@ class InlineQueryResultVoice(InlineQueryResult):
     ):
         # Required
         super().__init__(InlineQueryResultType.VOICE, id, api_kwargs=api_kwargs)
-        with self._unfrozen():
-            self.voice_url: str = voice_url
-            self.title: str = title
-
-            # Optional
-            self._voice_duration: dtm.timedelta | None = to_timedelta(voice_duration)
-            self.caption: str | None = caption
-            self.parse_mode: ODVInput[str] = parse_mode
-            self.caption_entities: tuple[MessageEntity, ...] = parse_sequence_arg(caption_entities)
-            self.reply_markup: InlineKeyboardMarkup | None = reply_markup
-            self.input_message_content: InputMessageContent | None = input_message_content
+        # This class is constructed in batches of up to 50 results per answered inline query, so
+        # we unfreeze & refreeze directly instead of entering the `_unfrozen` context manager
+        self._unfreeze()
+
+        self.voice_url: str = voice_url
+        self.title: str = title
+
+        # Optional
+        # voice_duration is unset for most inline voice results, so skip the conversion
+        # call entirely in that case
+        self._voice_duration: dtm.timedelta | None = (
+            None if voice_duration is None else to_timedelta(voice_duration)
+        )
+        self.caption: str | None = caption
+        self.parse_mode: ODVInput[str] = parse_mode
+        self.caption_entities: tuple[MessageEntity, ...] = parse_sequence_arg(caption_entities)
+        self.reply_markup: InlineKeyboardMarkup | None = reply_markup
+        self.input_message_content: InputMessageContent | None = input_message_content
+
+        self._cached_dict: JSONDict | None = None
+        self._freeze()
+
+    def to_dict(self, recursive: bool = True) -> JSONDict:
+        """See :meth:`telegram.TelegramObject.to_dict`.
+
+        Since objects of this class are immutable, the returned dictionary is computed only once
+        and cached. This is useful for bots that answer inline queries with stable result sets,
+        where the same result is serialized on every (partial) query.
+
+        Warning:
+            The returned dictionary is a shallow copy of the cache. Adding, replacing or removing
+            top-level entries is safe, but nested containers (e.g. the entries of
+            ``caption_entities``) are shared between calls and must not be modified.
+        """
+        if not recursive:
+            return super().to_dict(recursive=False)
+        if self._cached_dict is None:
+            self._cached_dict = super().to_dict(recursive=True)
+        # shallow copy: top-level modifications by the caller don't corrupt the cache, but
+        # nested containers are shared - see the docstring
+        return self._cached_dict.copy()
+
+    def _unfreeze(self) -> None:
+        # The object may be modified while unfrozen (e.g. when defaults are inserted in
+        # Bot._insert_defaults_for_ilq_results), so the cached dict must be invalidated
+        self._cached_dict = None
+        super()._unfreeze()
 
     @property
     def voice_duration(self) -> int | dtm.timedelta | None:
+        if self._voice_duration is None:
+            return None
         return get_timedelta_value(self._voice_duration, attribute="voice_duration")
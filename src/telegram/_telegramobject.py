@@ -21,16 +21,16 @@
 import contextlib
 import datetime as dtm
 import inspect
-import json
-from collections.abc import Iterator, Mapping, Sized
-from contextlib import contextmanager
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sized
 from copy import deepcopy
 from itertools import chain
+from operator import attrgetter
 from types import MappingProxyType
-from typing import TYPE_CHECKING, Any, ClassVar, TypeVar, cast
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, TypeVar, cast
 
 from telegram._utils.datetime import to_timestamp
 from telegram._utils.defaultvalue import DefaultValue
+from telegram._utils.json import json_dumps
 from telegram._utils.types import JSONDict
 from telegram._utils.warnings import warn
 
@@ -41,6 +41,36 @@ Tele_co = TypeVar("Tele_co", bound="TelegramObject", covariant=True)
 Tele = TypeVar("Tele", bound="TelegramObject")
 
 
+def _contains_telegram_objects(attrs: tuple[object, ...]) -> bool:
+    """Checks recursively whether any entry of ``attrs`` is a :class:`TelegramObject`. Used by
+    :meth:`TelegramObject.__hash__` to decide whether the hash may be cached.
+    """
+    return any(
+        isinstance(attr, TelegramObject)
+        or (isinstance(attr, tuple) and _contains_telegram_objects(attr))
+        for attr in attrs
+    )
+
+
+class _UnfrozenContext(Generic[Tele]):
+    """Lightweight context manager backing :meth:`TelegramObject._unfrozen`. Cheaper than
+    :func:`contextlib.contextmanager`, which allocates a generator and a
+    ``_GeneratorContextManager`` instance on every call.
+    """
+
+    __slots__ = ("_tg_object",)
+
+    def __init__(self, tg_object: Tele) -> None:
+        self._tg_object: Tele = tg_object
+
+    def __enter__(self) -> Tele:
+        self._tg_object._unfreeze()
+        return self._tg_object
+
+    def __exit__(self, *args: object) -> None:
+        self._tg_object._freeze()
+
+
 class TelegramObject:
     """Base class for most Telegram objects.
 
@@ -78,7 +108,7 @@ class TelegramObject:
 
     """
 
-    __slots__ = ("_bot", "_frozen", "_id_attrs", "api_kwargs")
+    __slots__ = ("_bot", "_cached_hash", "_frozen", "_id_attrs", "api_kwargs")
 
     # Used to cache the names of the parameters of the __init__ method of the class
     # Must be a private attribute to avoid name clashes between subclasses
@@ -88,6 +118,21 @@ class TelegramObject:
     # unless it's overridden
     __INIT_PARAMS_CHECK: type["TelegramObject"] | None = None
 
+    # Used to cache the names of all slots of the class, including those of its superclasses
+    # Must be a private attribute to avoid name clashes between subclasses
+    __ALL_SLOTS: ClassVar[tuple[str, ...]] = ()
+    # Used to check if __ALL_SLOTS has been set for the current class - same mechanism as
+    # __INIT_PARAMS_CHECK
+    __ALL_SLOTS_CHECK: type["TelegramObject"] | None = None
+
+    # Used to cache `(name, operator.attrgetter(name))` pairs for the slots of the class, once
+    # for all slots and once filtered to the attributes exposed by `_get_attrs_names`. The
+    # attrgetter objects are implemented in C and avoid repeated name-based lookups in the
+    # serialization hot loop of `_get_attrs`
+    __SLOT_GETTERS: ClassVar[tuple[tuple[str, Callable[[Any], Any]], ...]] = ()
+    __PUBLIC_SLOT_GETTERS: ClassVar[tuple[tuple[str, Callable[[Any], Any]], ...]] = ()
+    __SLOT_GETTERS_CHECK: type["TelegramObject"] | None = None
+
     def __init__(self, *, api_kwargs: JSONDict | None = None) -> None:
         # Setting _frozen to `False` here means that classes without arguments still need to
         # implement __init__. However, with `True` would mean increased usage of
@@ -95,6 +140,7 @@ class TelegramObject:
         # classes than classes with arguments.
         self._frozen: bool = False
         self._id_attrs: tuple[object, ...] = ()
+        self._cached_hash: int | None = None
         self._bot: Bot | None = None
         # We don't do anything with api_kwargs here - see docstring of _apply_api_kwargs
         self.api_kwargs: Mapping[str, Any] = MappingProxyType(api_kwargs or {})
@@ -140,11 +186,24 @@ class TelegramObject:
         """Builds a hash value for this object such that the hash of two objects is equal if and
         only if the objects are equal in terms of :meth:`__eq__`.
 
+        Since :attr:`_id_attrs` can no longer change once the object is frozen, the hash is
+        computed only once and cached for frozen objects. This speeds up repeated dict/set
+        membership tests. Objects whose :attr:`_id_attrs` contain other instances of this class
+        are excluded from caching: those nested objects may be modified in place without this
+        object noticing (e.g. :meth:`telegram.InlineKeyboardButton.update_callback_data` changes
+        the buttons contained in the :attr:`_id_attrs` of a frozen
+        :class:`telegram.InlineKeyboardMarkup`), which would leave a stale cached hash behind.
+
         Returns:
             :obj:`int`
         """
         if self._id_attrs:
-            return hash((self.__class__, self._id_attrs))
+            if (cached_hash := self._cached_hash) is not None:
+                return cached_hash
+            computed_hash = hash((self.__class__, self._id_attrs))
+            if self._frozen and not _contains_telegram_objects(self._id_attrs):
+                self._cached_hash = computed_hash
+            return computed_hash
         return super().__hash__()
 
     def __setattr__(self, key: str, value: object) -> None:
@@ -156,6 +215,11 @@ class TelegramObject:
         # protected attributes can always be set for convenient internal use
         if key[0] == "_" or not self._frozen:
             super().__setattr__(key, value)
+            if key == "_id_attrs":
+                # The id attributes may be updated even after the hash was computed, e.g. in
+                # InlineKeyboardButton.update_callback_data. Invalidate the cached hash in that
+                # case.
+                super().__setattr__("_cached_hash", None)
             return
 
         raise AttributeError(
@@ -262,6 +326,9 @@ class TelegramObject:
         out = self._get_attrs(
             include_private=True, recursive=False, remove_bot=True, convert_default_value=False
         )
+        # The cached hash is not valid across interpreter sessions, since string hashes are
+        # randomized per process. It's recomputed on demand after unpickling.
+        out.pop("_cached_hash", None)
         # MappingProxyType is not pickable, so we convert it to a dict and revert in
         # __setstate__
         out["api_kwargs"] = dict(self.api_kwargs)
@@ -287,8 +354,10 @@ class TelegramObject:
         self._unfreeze()
 
         # Make sure that we have a `_bot` attribute. This is necessary, since __getstate__ omits
-        # this as Bots are not pickable.
+        # this as Bots are not pickable. The same holds for `_cached_hash`, which is not
+        # valid across interpreter sessions.
         self._bot = None
+        self._cached_hash = None
 
         # get api_kwargs first because we may need to add entries to it (see try-except below)
         api_kwargs = cast("dict[str, object]", state.pop("api_kwargs", {}))
@@ -457,17 +526,14 @@ class TelegramObject:
         """
         return tuple(cls.de_json(d, bot) for d in data)
 
-    @contextmanager
-    def _unfrozen(self: Tele) -> Iterator[Tele]:
+    def _unfrozen(self: Tele) -> _UnfrozenContext[Tele]:
         """Context manager to temporarily unfreeze the object. For internal use only.
 
         Note:
             with to._unfrozen() as other_to:
                 assert to is other_to
         """
-        self._unfreeze()
-        yield self
-        self._freeze()
+        return _UnfrozenContext(self)
 
     def _freeze(self) -> None:
         self._frozen = True
@@ -506,6 +572,43 @@ class TelegramObject:
             class_name := self.__class__.__name__
         ) in _TIME_PERIOD_DEPRECATIONS and attr in _TIME_PERIOD_DEPRECATIONS[class_name]
 
+    @classmethod
+    def _all_slots(cls) -> tuple[str, ...]:
+        """Returns the names of all slots of the class, including those of its superclasses.
+
+        We want to get all attributes for the class, using cls.__slots__ only includes the
+        attributes used by that class itself, and not its superclass(es). Hence, we get its
+        MRO and then get their attributes. The `[:-1]` slice excludes the `object` class.
+        Since the result only depends on the class, we cache it - this is needed by
+        every `to_dict`/`__repr__`/pickle operation and walking the MRO each time adds up.
+        """
+        if cls.__ALL_SLOTS_CHECK is not cls:
+            cls.__ALL_SLOTS = tuple(
+                s
+                for c in cls.__mro__[:-1]
+                for s in c.__slots__  # type: ignore[attr-defined]
+            )
+            cls.__ALL_SLOTS_CHECK = cls
+        return cls.__ALL_SLOTS
+
+    @classmethod
+    def _slot_getters(cls, include_private: bool) -> tuple[tuple[str, Callable[[Any], Any]], ...]:
+        """Returns `(name, operator.attrgetter(name))` pairs for the slots of the class,
+        optionally filtered to the attributes exposed by :meth:`_get_attrs_names`. The pairs only
+        depend on the class, so they are cached - see :meth:`_all_slots`.
+        """
+        if cls.__SLOT_GETTERS_CHECK is not cls:
+            cls.__SLOT_GETTERS = tuple((name, attrgetter(name)) for name in cls._all_slots())
+            deprecated_attrs = _TIME_PERIOD_DEPRECATIONS.get(cls.__name__, ())
+            cls.__PUBLIC_SLOT_GETTERS = tuple(
+                (name, getter)
+                for name, getter in cls.__SLOT_GETTERS
+                # Include deprecated private attributes, which are exposed via properties
+                if not name.startswith("_") or name in deprecated_attrs
+            )
+            cls.__SLOT_GETTERS_CHECK = cls
+        return cls.__SLOT_GETTERS if include_private else cls.__PUBLIC_SLOT_GETTERS
+
     def _get_attrs_names(self, include_private: bool) -> Iterator[str]:
         """
         Returns the names of the attributes of this object. This is used to determine which
@@ -517,10 +620,7 @@ class TelegramObject:
         Returns:
             Iterator[:obj:`str`]: An iterator over the names of the attributes of this object.
         """
-        # We want to get all attributes for the class, using self.__slots__ only includes the
-        # attributes used by that class itself, and not its superclass(es). Hence, we get its MRO
-        # and then get their attributes. The `[:-1]` slice excludes the `object` class
-        all_slots = (s for c in self.__class__.__mro__[:-1] for s in c.__slots__)  # type: ignore
+        all_slots: Iterator[str] = iter(self._all_slots())
         # chain the class's slots with the user defined subclass __dict__ (class has no slots)
         all_attrs = (
             chain(all_slots, self.__dict__.keys()) if hasattr(self, "__dict__") else all_slots
@@ -557,14 +657,33 @@ class TelegramObject:
         Returns:
             :obj:`dict`: A dict where the keys are attribute names and values are their values.
         """
+        items: Iterable[tuple[str, Callable[[Any], Any] | None]] = self._slot_getters(
+            include_private
+        )
+        if hasattr(self, "__dict__"):
+            # chain the class's slots with the user defined subclass __dict__ (class has no
+            # slots). This path is rare, so plain getattr (getter=None) is good enough here.
+            items = chain(
+                items,
+                (
+                    (key, None)
+                    for key in self.__dict__
+                    if include_private or not key.startswith("_") or self._is_deprecated_attr(key)
+                ),
+            )
+
         data = {}
 
-        for key in self._get_attrs_names(include_private=include_private):
-            value = (
-                DefaultValue.get_value(getattr(self, key, None))
-                if convert_default_value
-                else getattr(self, key, None)
-            )
+        for key, getter in items:
+            if getter is None:
+                value = getattr(self, key, None)
+            else:
+                try:
+                    value = getter(self)
+                except AttributeError:
+                    value = None
+            if convert_default_value:
+                value = DefaultValue.get_value(value)
 
             if value is not None:
                 if recursive and hasattr(value, "to_dict"):
@@ -589,7 +708,7 @@ class TelegramObject:
         Returns:
             :obj:`str`
         """
-        return json.dumps(self.to_dict())
+        return json_dumps(self.to_dict())
 
     def to_dict(self, recursive: bool = True) -> JSONDict:
         """Gives representation of object as :obj:`dict`.
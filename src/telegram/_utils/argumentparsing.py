@@ -49,7 +49,20 @@ def parse_sequence_arg(arg: Sequence[T] | None) -> tuple[T, ...]:
     Returns:
         :obj:`Tuple`: The sequence converted to a tuple or an empty tuple.
     """
-    return tuple(arg) if arg else ()
+    if not arg:
+        # CPython interns the empty tuple, so this does not allocate
+        return ()
+    # The exact-type check is deliberate: it is cheaper than isinstance and tuple subclasses
+    # must still be copied into a plain tuple below
+    if type(arg) is tuple:  # pylint: disable=unidiomatic-typecheck
+        # Exact tuples can be returned as-is, avoiding the tuple() call. This is the common case
+        # when attributes of de-serialized objects are passed around internally.
+        return arg
+    return tuple(arg)
+
+
+# Hoisted to module level such that `to_timedelta` doesn't rebuild the type union on every call
+_NUMERIC_TYPES = (int, float)
 
 
 @overload
@@ -75,7 +88,7 @@ def to_timedelta(arg: int | float | dtm.timedelta | None) -> dtm.timedelta | Non
     """
     if arg is None:
         return None
-    if isinstance(arg, int | float):
+    if isinstance(arg, _NUMERIC_TYPES):
         return dtm.timedelta(seconds=arg)
     return arg
 
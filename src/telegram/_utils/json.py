@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2026
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains helper functions for JSON (de)serialization.
+
+The functions defer to `orjson <https://github.com/ijl/orjson>`_ if it is installed and fall
+back to the standard library's :mod:`json` module otherwise. JSON encoding and decoding happens
+on every request to the Bot API, so using a compiled JSON library can noticeably reduce the CPU
+time spent on (de)serialization, e.g. when answering inline queries with many results.
+
+Warning:
+    Contents of this module are intended to be used internally by the library and *not* by the
+    user. Changes to this module are not considered breaking changes and may not be documented in
+    the changelog.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+if orjson is not None:
+    # OPT_NON_STR_KEYS makes orjson coerce non-string dict keys (e.g. booleans) to strings
+    # just like the standard library does
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def json_dumps(obj: Any) -> str:
+        """Serialize ``obj`` to a JSON formatted string."""
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode("utf-8")
+
+    def json_loads(string: str | bytes) -> Any:
+        """Deserialize a JSON formatted string to a Python object."""
+        return orjson.loads(string)
+
+else:
+
+    def json_dumps(obj: Any) -> str:
+        """Serialize ``obj`` to a JSON formatted string."""
+        # Compact separators to stay consistent with the output of orjson
+        return json.dumps(obj, separators=(",", ":"))
+
+    def json_loads(string: str | bytes) -> Any:
+        """Deserialize a JSON formatted string to a Python object."""
+        return json.loads(string)
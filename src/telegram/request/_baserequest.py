@@ -19,7 +19,6 @@
 """This module contains an abstract class to make POST and GET requests."""
 
 import abc
-import json
 from contextlib import AbstractAsyncContextManager
 from http import HTTPStatus
 from types import TracebackType
@@ -27,6 +26,7 @@ from typing import Final, TypeVar, final
 
 from telegram._utils.defaultvalue import DEFAULT_NONE as _DEFAULT_NONE
 from telegram._utils.defaultvalue import DefaultValue
+from telegram._utils.json import json_loads
 from telegram._utils.logging import get_logger
 from telegram._utils.strings import TextEncoding
 from telegram._utils.types import JSONDict, ODVInput
@@ -76,7 +76,8 @@ class BaseRequest(
     .. seealso:: :meth:`__aenter__` and :meth:`__aexit__`.
 
     Tip:
-        JSON encoding and decoding is done with the standard library's :mod:`json` by default.
+        JSON encoding and decoding is done with `orjson <https://github.com/ijl/orjson>`_ if it
+        is installed and with the standard library's :mod:`json` otherwise.
         To use a custom library for this, you can override :meth:`parse_json_payload` and implement
         custom logic to encode the keys of :attr:`telegram.request.RequestData.parameters`.
 
@@ -379,8 +380,9 @@ class BaseRequest(
         """Parse the JSON returned from Telegram.
 
         Tip:
-            By default, this method uses the standard library's :func:`json.loads` and
-            ``errors="replace"`` in :meth:`bytes.decode`.
+            By default, this method uses `orjson <https://github.com/ijl/orjson>`_ if it is
+            installed, :func:`json.loads` otherwise, and ``errors="replace"`` in
+            :meth:`bytes.decode`.
             You can override it to customize either of these behaviors.
 
         Args:
@@ -394,7 +396,7 @@ class BaseRequest(
         """
         decoded_s = payload.decode(TextEncoding.UTF_8, "replace")
         try:
-            return json.loads(decoded_s)
+            return json_loads(decoded_s)
         except ValueError as exc:
             _LOGGER.exception('Can not load invalid JSON data: "%s"', decoded_s)
             raise TelegramError("Invalid server response") from exc
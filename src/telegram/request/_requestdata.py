@@ -18,10 +18,10 @@
 #  along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains a class that holds the parameters of a request to the Bot API."""
 
-import json
 from typing import Any, final
 from urllib.parse import urlencode
 
+from telegram._utils.json import json_dumps
 from telegram._utils.strings import TextEncoding
 from telegram._utils.types import UploadFileDict
 from telegram.request._requestparameter import RequestParameter
@@ -72,7 +72,8 @@ class RequestData:
         value.
 
         Tip:
-            By default, this property uses the standard library's :func:`json.dumps`.
+            By default, this property uses `orjson <https://github.com/ijl/orjson>`_ if it is
+            installed and the standard library's :func:`json.dumps` otherwise.
             To use a custom library for JSON encoding, you can directly encode the keys of
             :attr:`parameters` - note that string valued keys should not be JSON encoded.
 
@@ -119,14 +120,15 @@ class RequestData:
         """The :attr:`parameters` as UTF-8 encoded JSON payload.
 
         Tip:
-            By default, this property uses the standard library's :func:`json.dumps`.
+            By default, this property uses `orjson <https://github.com/ijl/orjson>`_ if it is
+            installed and the standard library's :func:`json.dumps` otherwise.
             To use a custom library for JSON encoding, you can directly encode the keys of
             :attr:`parameters` - note that string valued keys should not be JSON encoded.
 
         Returns:
             :obj:`bytes`
         """
-        return json.dumps(self.json_parameters).encode(TextEncoding.UTF_8)
+        return json_dumps(self.json_parameters).encode(TextEncoding.UTF_8)
 
     @property
     def multipart_data(self) -> UploadFileDict:
@@ -19,7 +19,6 @@
 """This module contains a class that describes a single parameter of a request to the Bot API."""
 
 import datetime as dtm
-import json
 from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import final
@@ -32,6 +31,7 @@ from telegram._files.inputstorycontent import InputStoryContent
 from telegram._telegramobject import TelegramObject
 from telegram._utils.datetime import to_timestamp
 from telegram._utils.enum import StringEnum
+from telegram._utils.json import json_dumps
 from telegram._utils.types import UploadFileDict
 
 
@@ -77,7 +77,7 @@ class RequestParameter:
             return self.value
         if self.value is None:
             return None
-        return json.dumps(self.value)
+        return json_dumps(self.value)
 
     @property
     def multipart_data(self) -> UploadFileDict | None:
@@ -117,6 +117,31 @@ class TestInlineQueryResultVoiceWithoutRequest(InlineQueryResultVoiceTestBase):
             == inline_query_result_voice.reply_markup.to_dict()
         )
 
+    def test_to_dict_caching(self):
+        result = InlineQueryResultVoice(self.id_, self.voice_url, self.title)
+        first = result.to_dict()
+
+        cached = result._cached_dict
+        assert cached is not None
+        second = result.to_dict()
+        assert result._cached_dict is cached
+
+        # callers get equal but distinct dicts, so top-level modifications don't leak into
+        # later calls
+        assert second == first
+        assert second is not first
+        first["title"] = "modified"
+        assert result.to_dict()["title"] == self.title
+
+    def test_to_dict_cache_invalidation(self):
+        result = InlineQueryResultVoice(self.id_, self.voice_url, self.title)
+        assert result.to_dict()["title"] == self.title
+
+        with result._unfrozen():
+            result.title = "new title"
+
+        assert result.to_dict()["title"] == "new title"
+
     def test_time_period_properties(self, PTB_TIMEDELTA, inline_query_result_voice):
         voice_duration = inline_query_result_voice.voice_duration
 
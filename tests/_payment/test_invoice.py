@@ -162,7 +162,7 @@ class TestInvoiceWithoutRequest(InvoiceTestBase):
         self, monkeypatch, offline_bot, chat_id, provider_token
     ):
         async def make_assertion(url, request_data: RequestData, *args, **kwargs):
-            return request_data.json_parameters["provider_data"] == '{"test_data": 123456789}'
+            return request_data.json_parameters["provider_data"] == '{"test_data":123456789}'
 
         monkeypatch.setattr(offline_bot.request, "post", make_assertion)
 
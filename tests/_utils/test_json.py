@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2026
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import importlib.util
+import sys
+
+import pytest
+
+from telegram._utils import json as ptb_json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@pytest.fixture
+def stdlib_json(monkeypatch):
+    """A fresh copy of telegram._utils.json for which orjson is not importable, i.e. the
+    standard library fallback. Loaded under a different name so that neither sys.modules nor the
+    module used by the library is touched.
+    """
+    # Setting the sys.modules entry to None makes `import orjson` raise ImportError
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    spec = importlib.util.spec_from_file_location("stdlib_json", ptb_json.__file__)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestJson:
+    def test_orjson_used_if_available(self, stdlib_json):
+        if orjson is None:
+            pytest.skip("orjson is not installed")
+        assert ptb_json.orjson is orjson
+        assert stdlib_json.orjson is None
+
+    @pytest.mark.parametrize(
+        ("obj", "expected"),
+        [
+            ("text", '"text"'),
+            (123, "123"),
+            (None, "null"),
+            ([1, "1"], '[1,"1"]'),
+            ((1, "1"), '[1,"1"]'),
+            # both implementations coerce non-string keys to strings
+            ({True: None}, '{"true":null}'),
+            ({"a": 1, "b": [1, 2], "c": {"d": True}}, '{"a":1,"b":[1,2],"c":{"d":true}}'),
+        ],
+    )
+    def test_json_dumps(self, stdlib_json, obj, expected):
+        # both code paths must produce identical, compact output
+        assert ptb_json.json_dumps(obj) == expected
+        assert stdlib_json.json_dumps(obj) == expected
+
+    @pytest.mark.parametrize(
+        ("string", "expected"),
+        [
+            ('"text"', "text"),
+            ("123", 123),
+            ("null", None),
+            ('[1,"1"]', [1, "1"]),
+            ('{"a": 1, "b": [1, 2], "c": {"d": true}}', {"a": 1, "b": [1, 2], "c": {"d": True}}),
+        ],
+    )
+    def test_json_loads(self, stdlib_json, string, expected):
+        for data in (string, string.encode("utf-8")):
+            assert ptb_json.json_loads(data) == expected
+            assert stdlib_json.json_loads(data) == expected
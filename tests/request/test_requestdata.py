@@ -16,13 +16,13 @@
 #
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
-import json
 from typing import Any
 from urllib.parse import quote
 
 import pytest
 
 from telegram import InputFile, InputMediaPhoto, InputMediaVideo, MessageEntity
+from telegram._utils.json import json_dumps
 from telegram.request import RequestData
 from telegram.request._requestparameter import RequestParameter
 from tests.auxil.files import data_file
@@ -65,9 +65,9 @@ def simple_params() -> dict[str, Any]:
 def simple_jsons() -> dict[str, Any]:
     return {
         "string": "string",
-        "integer": json.dumps(1),
+        "integer": json_dumps(1),
         "tg_object": MessageEntity("type", 1, 1).to_json(),
-        "list": json.dumps([1, "string", MessageEntity("type", 1, 1).to_dict()]),
+        "list": json_dumps([1, "string", MessageEntity("type", 1, 1).to_dict()]),
     }
 
 
@@ -97,8 +97,8 @@ def file_jsons(inputfiles, input_media_video, input_media_photo) -> dict[str, An
     input_media_photo_dict["media"] = input_media_photo.media.attach_uri
     return {
         "inputfile_attach": inputfiles[True].attach_uri,
-        "inputmedia": json.dumps(input_media_video_dict),
-        "inputmedia_list": json.dumps([input_media_video_dict, input_media_photo_dict]),
+        "inputmedia": json_dumps(input_media_video_dict),
+        "inputmedia_list": json_dumps([input_media_video_dict, input_media_photo_dict]),
     }
 
 
@@ -178,9 +178,9 @@ class TestRequestDataWithoutRequest:
     def test_json_payload(
         self, simple_rqs, file_rqs, mixed_rqs, simple_jsons, file_jsons, mixed_jsons
     ):
-        assert simple_rqs.json_payload == json.dumps(simple_jsons).encode()
-        assert file_rqs.json_payload == json.dumps(file_jsons).encode()
-        assert mixed_rqs.json_payload == json.dumps(mixed_jsons).encode()
+        assert simple_rqs.json_payload == json_dumps(simple_jsons).encode()
+        assert file_rqs.json_payload == json_dumps(file_jsons).encode()
+        assert mixed_rqs.json_payload == json_dumps(mixed_jsons).encode()
 
     def test_multipart_data(
         self,
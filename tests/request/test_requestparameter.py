@@ -63,8 +63,8 @@ class TestRequestParameterWithoutRequest:
             ("one", "one"),
             (True, "true"),
             (None, None),
-            ([1, "1"], '[1, "1"]'),
-            ({True: None}, '{"true": null}'),
+            ([1, "1"], '[1,"1"]'),
+            ({True: None}, '{"true":null}'),
             ((1,), "[1]"),
         ],
     )
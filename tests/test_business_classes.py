@@ -43,6 +43,7 @@ class BusinessTestBase:
     user = User(123, "test_user", False)
     user_chat_id = 123
     date = dtm.datetime.now(tz=UTC).replace(microsecond=0)
+    date_ts = to_timestamp(date)
     can_change_gift_settings = True
     can_convert_gifts_to_stars = True
     can_delete_all_messages = True
@@ -59,6 +60,7 @@ class BusinessTestBase:
     can_view_gifts_and_stars = True
     is_enabled = True
     message_ids = (123, 321)
+    message_ids_list = list(message_ids)
     business_connection_id = "123"
     chat = Chat(123, "test_chat")
     title = "Business Title"
@@ -69,12 +71,20 @@ class BusinessTestBase:
     opening_minute = 0
     closing_minute = 60
     time_zone_name = "Country/City"
-    opening_hours = [
+    # constant data shared by all tests in this module - built once as an immutable tuple
+    opening_hours = tuple(
         BusinessOpeningHoursInterval(opening, opening + 60) for opening in (0, 24 * 60)
-    ]
+    )
+    # to_dict() outputs of the nested objects, precomputed since they are reused in many
+    # assertions
+    user_dict = user.to_dict()
+    chat_dict = chat.to_dict()
+    sticker_dict = sticker.to_dict()
+    location_dict = location.to_dict()
+    opening_hours_dicts = [opening.to_dict() for opening in opening_hours]
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def business_bot_rights():
     return BusinessBotRights(
         can_change_gift_settings=BusinessTestBase.can_change_gift_settings,
@@ -94,7 +104,7 @@ def business_bot_rights():
     )
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def business_connection(business_bot_rights):
     return BusinessConnection(
         BusinessTestBase.id_,
@@ -106,7 +116,7 @@ def business_connection(business_bot_rights):
     )
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def business_messages_deleted():
     return BusinessMessagesDeleted(
         BusinessTestBase.business_connection_id,
@@ -115,7 +125,7 @@ def business_messages_deleted():
     )
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def business_intro():
     return BusinessIntro(
         BusinessTestBase.title,
@@ -124,7 +134,7 @@ def business_intro():
     )
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def business_location():
     return BusinessLocation(
         BusinessTestBase.address,
@@ -132,7 +142,7 @@ def business_location():
     )
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def business_opening_hours_interval():
     return BusinessOpeningHoursInterval(
         BusinessTestBase.opening_minute,
@@ -140,7 +150,7 @@ def business_opening_hours_interval():
     )
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def business_opening_hours():
     return BusinessOpeningHours(
         BusinessTestBase.time_zone_name,
@@ -242,9 +252,9 @@ class TestBusinessConnectionWithoutRequest(BusinessTestBase):
     def test_de_json(self, business_bot_rights):
         json_dict = {
             "id": self.id_,
-            "user": self.user.to_dict(),
+            "user": self.user_dict,
             "user_chat_id": self.user_chat_id,
-            "date": to_timestamp(self.date),
+            "date": self.date_ts,
             "is_enabled": self.is_enabled,
             "rights": business_bot_rights.to_dict(),
         }
@@ -261,9 +271,9 @@ class TestBusinessConnectionWithoutRequest(BusinessTestBase):
     def test_de_json_localization(self, offline_bot, raw_bot, tz_bot, business_bot_rights):
         json_dict = {
             "id": self.id_,
-            "user": self.user.to_dict(),
+            "user": self.user_dict,
             "user_chat_id": self.user_chat_id,
-            "date": to_timestamp(self.date),
+            "date": self.date_ts,
             "is_enabled": self.is_enabled,
             "rights": business_bot_rights.to_dict(),
         }
@@ -283,9 +293,9 @@ class TestBusinessConnectionWithoutRequest(BusinessTestBase):
         bc_dict = business_connection.to_dict()
         assert isinstance(bc_dict, dict)
         assert bc_dict["id"] == self.id_
-        assert bc_dict["user"] == self.user.to_dict()
+        assert bc_dict["user"] == self.user_dict
         assert bc_dict["user_chat_id"] == self.user_chat_id
-        assert bc_dict["date"] == to_timestamp(self.date)
+        assert bc_dict["date"] == self.date_ts
         assert bc_dict["is_enabled"] == self.is_enabled
         assert bc_dict["rights"] == business_bot_rights.to_dict()
 
@@ -343,14 +353,14 @@ class TestBusinessMessagesDeleted(BusinessTestBase):
     def test_to_dict(self, business_messages_deleted):
         bmd_dict = business_messages_deleted.to_dict()
         assert isinstance(bmd_dict, dict)
-        assert bmd_dict["message_ids"] == list(self.message_ids)
+        assert bmd_dict["message_ids"] == self.message_ids_list
         assert bmd_dict["business_connection_id"] == self.business_connection_id
-        assert bmd_dict["chat"] == self.chat.to_dict()
+        assert bmd_dict["chat"] == self.chat_dict
 
     def test_de_json(self):
         json_dict = {
             "business_connection_id": self.business_connection_id,
-            "chat": self.chat.to_dict(),
+            "chat": self.chat_dict,
             "message_ids": self.message_ids,
         }
         bmd = BusinessMessagesDeleted.de_json(json_dict, None)
@@ -384,13 +394,13 @@ class TestBusinessIntroWithoutRequest(BusinessTestBase):
         assert isinstance(intro_dict, dict)
         assert intro_dict["title"] == self.title
         assert intro_dict["message"] == self.message
-        assert intro_dict["sticker"] == self.sticker.to_dict()
+        assert intro_dict["sticker"] == self.sticker_dict
 
     def test_de_json(self):
         json_dict = {
             "title": self.title,
             "message": self.message,
-            "sticker": self.sticker.to_dict(),
+            "sticker": self.sticker_dict,
         }
         intro = BusinessIntro.de_json(json_dict, None)
         assert intro.title == self.title
@@ -423,12 +433,12 @@ class TestBusinessLocationWithoutRequest(BusinessTestBase):
         blc_dict = business_location.to_dict()
         assert isinstance(blc_dict, dict)
         assert blc_dict["address"] == self.address
-        assert blc_dict["location"] == self.location.to_dict()
+        assert blc_dict["location"] == self.location_dict
 
     def test_de_json(self):
         json_dict = {
             "address": self.address,
-            "location": self.location.to_dict(),
+            "location": self.location_dict,
         }
         blc = BusinessLocation.de_json(json_dict, None)
         assert blc.address == self.address
@@ -531,16 +541,16 @@ class TestBusinessOpeningHoursWithoutRequest(BusinessTestBase):
         boh_dict = business_opening_hours.to_dict()
         assert isinstance(boh_dict, dict)
         assert boh_dict["time_zone_name"] == self.time_zone_name
-        assert boh_dict["opening_hours"] == [opening.to_dict() for opening in self.opening_hours]
+        assert boh_dict["opening_hours"] == self.opening_hours_dicts
 
     def test_de_json(self):
         json_dict = {
             "time_zone_name": self.time_zone_name,
-            "opening_hours": [opening.to_dict() for opening in self.opening_hours],
+            "opening_hours": self.opening_hours_dicts,
         }
         boh = BusinessOpeningHours.de_json(json_dict, None)
         assert boh.time_zone_name == self.time_zone_name
-        assert boh.opening_hours == tuple(self.opening_hours)
+        assert boh.opening_hours == self.opening_hours
         assert boh.api_kwargs == {}
         assert isinstance(boh, BusinessOpeningHours)
 
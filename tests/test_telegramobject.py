@@ -72,9 +72,9 @@ class TestTelegramObject:
 
         json = Subclass().to_json()
         # Order isn't guarantied
-        assert '"arg": "arg"' in json
-        assert '"arg2": ["arg2", "arg2"]' in json
-        assert '"arg3": {"arg3": "arg3"}' in json
+        assert '"arg":"arg"' in json
+        assert '"arg2":["arg2","arg2"]' in json
+        assert '"arg3":{"arg3":"arg3"}' in json
         assert "empty_tuple" not in json
 
         # Now make sure that it doesn't work with not json stuff and that it fails loudly
@@ -254,6 +254,44 @@ class TestTelegramObject:
         assert b == a
         assert len(recwarn) == 0
 
+    def test_hash_caching(self):
+        bot_command = BotCommand("command", "description")
+        assert bot_command._cached_hash is None
+
+        expected = hash((BotCommand, bot_command._id_attrs))
+        assert hash(bot_command) == expected
+        # repeated calls reuse the cached value
+        assert bot_command._cached_hash == expected
+        assert hash(bot_command) == expected
+
+    def test_hash_not_cached_while_unfrozen(self):
+        bot_command = BotCommand("command", "description")
+        with bot_command._unfrozen():
+            assert hash(bot_command) == hash((BotCommand, bot_command._id_attrs))
+            assert bot_command._cached_hash is None
+            # changing the id attributes while unfrozen must be reflected by the hash
+            bot_command.command = "other_command"
+            bot_command._id_attrs = (bot_command.command, bot_command.description)
+        assert hash(bot_command) == hash((BotCommand, ("other_command", "description")))
+
+    def test_hash_not_cached_for_nested_telegram_objects(self):
+        # the chat contained in the id attributes may be mutated in place without the message
+        # noticing, so the hash must be recomputed on every call
+        message = Message(1, dtm.datetime.now(), Chat(2, Chat.PRIVATE))
+        assert hash(message) == hash((Message, message._id_attrs))
+        assert message._cached_hash is None
+
+    def test_hash_cache_not_pickled(self):
+        bot_command = BotCommand("command", "description")
+        hash(bot_command)
+        assert bot_command._cached_hash is not None
+
+        unpickled = pickle.loads(pickle.dumps(bot_command))
+        # string hashes are salted per interpreter run, so a cached hash must not survive
+        # pickling
+        assert unpickled._cached_hash is None
+        assert hash(unpickled) == hash(bot_command)
+
     def test_bot_instance_none(self):
         tg_object = TelegramObject()
         with pytest.raises(RuntimeError):